@@ -48,6 +48,10 @@ class Config:
                 'exclude_tags': [],
                 'collections': []
             },
+            'search': {
+                'enabled': False,
+                'index_file': None
+            },
             'advanced': {
                 'incremental_update': False,
                 'overwrite_existing': True,
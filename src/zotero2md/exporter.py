@@ -5,10 +5,11 @@ from jinja2 import Environment, FileSystemLoader
 from typing import Dict, Any, Optional
 
 class MarkdownExporter:
-    def __init__(self, template_dir='templates', template_name='default.md', config=None):
+    def __init__(self, template_dir='templates', template_name='default.md', config=None, search_index=None):
         self.env = Environment(loader=FileSystemLoader(template_dir))
         self.template = self.env.get_template(template_name)
         self.config = config
+        self.search_index = search_index
         self.exported_files = {}
 
     def sanitize_filename(self, title: str, max_length: int = 200) -> str:
@@ -82,11 +83,16 @@ class MarkdownExporter:
         
         content = self.render(item_data)
         
-        if not self.should_export(file_path, content):
-            return None
+        written = self.should_export(file_path, content)
+        if written:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        
+        if self.search_index:
+            self.search_index.update(item_data, file_path)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if not written:
+            return None
         
         self.exported_files[item_data.get('key', '')] = str(file_path)
         return file_path
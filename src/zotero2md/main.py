@@ -1,4 +1,5 @@
 import argparse
+import sqlite3
 import sys
 import os
 from pathlib import Path
@@ -6,8 +7,53 @@ from zotero2md.database import ZoteroConnector
 from zotero2md.parser import ZoteroParser
 from zotero2md.exporter import MarkdownExporter
 from zotero2md.config import Config
+from zotero2md.search import SearchIndex
 from zotero2md.logger import setup_logger, get_logger
 
+INDEX_FILENAME = '.zotero2md_index.sqlite'
+
+def resolve_index_path(args, config):
+    index_file = args.index_file or config.get('search.index_file')
+    if index_file:
+        return index_file
+    return str(Path(args.out) / INDEX_FILENAME)
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"必须为正整数: {value}")
+    return number
+
+def run_search(args, config):
+    index_path = resolve_index_path(args, config)
+    if not Path(index_path).exists():
+        print(f"[!] 搜索索引不存在: {index_path}，请先使用 --index 导出")
+        sys.exit(1)
+    
+    index = SearchIndex(index_path)
+    try:
+        results = index.search(args.query, limit=args.max_results)
+    except sqlite3.OperationalError as e:
+        print(f"[!] 搜索失败: {e}")
+        print('[!] 查询语法遵循 SQLite FTS5，包含 "-" 等特殊字符的词请用双引号括起来，例如: \'"self-attention"\'')
+        sys.exit(1)
+    except Exception as e:
+        print(f"[!] 搜索失败: {e}")
+        sys.exit(1)
+    finally:
+        index.close()
+    
+    if not results:
+        print("[*] 未找到匹配的条目")
+        return
+    
+    for row in results:
+        print(f"{row['title'] or 'Untitled'} [{row['key']}]")
+        if row['path']:
+            print(f"    {row['path']}")
+        if row['snippet']:
+            print(f"    {' '.join(row['snippet'].split())}")
+
 def main():
     parser = argparse.ArgumentParser(
         description="Zotero to Markdown 导出工具 (基于本地数据库)",
@@ -19,6 +65,8 @@ def main():
   python -m zotero2md.main --limit 10               # 只导出前10个条目
   python -m zotero2md.main --config myconfig.yml   # 使用自定义配置
   python -m zotero2md.main --generate-config       # 生成默认配置文件
+  python -m zotero2md.main --index                 # 导出时同时更新全文索引
+  python -m zotero2md.main search "deep learning"  # 在全文索引中搜索
         """
     )
     parser.add_argument("--db", help="Zotero 数据库路径 (可选)")
@@ -30,6 +78,16 @@ def main():
     parser.add_argument("--log-file", help="日志文件路径")
     parser.add_argument("--verbose", action="store_true", help="详细输出")
     parser.add_argument("--generate-config", action="store_true", help="生成默认配置文件")
+    parser.add_argument("--index", action="store_true", help="导出时同时更新 SQLite 全文索引")
+    parser.add_argument("--index-file", help=f"全文索引文件路径 (默认: <输出目录>/{INDEX_FILENAME})")
+    
+    subparsers = parser.add_subparsers(dest="command")
+    search_parser = subparsers.add_parser("search", help="在全文索引中搜索条目")
+    search_parser.add_argument("query", help="FTS5 查询语句，例如: transformer AND tags:nlp")
+    search_parser.add_argument("--out", default=argparse.SUPPRESS, help="导出时使用的输出目录 (默认: output)")
+    search_parser.add_argument("--index-file", default=argparse.SUPPRESS, help="全文索引文件路径")
+    search_parser.add_argument("--config", default=argparse.SUPPRESS, help="配置文件路径")
+    search_parser.add_argument("-n", "--max-results", type=positive_int, default=20, help="最多显示的结果数 (默认: 20)")
     
     args = parser.parse_args()
     
@@ -38,6 +96,10 @@ def main():
         config.save_default_config()
         return
     
+    if args.command == "search":
+        run_search(args, Config(args.config))
+        return
+    
     try:
         config = Config(args.config)
         logger = setup_logger(
@@ -69,62 +131,77 @@ def main():
         template_name = args.template or config.get('export.template', 'default.md')
         convert_html = config.get('export.convert_html_notes', True)
         
-        exporter = MarkdownExporter(
-            template_dir=template_dir,
-            template_name=template_name,
-            config=config
-        )
+        search_index = None
+        if args.index or config.get('search.enabled', False):
+            index_path = resolve_index_path(args, config)
+            search_index = SearchIndex(index_path, batch_size=config.get('advanced.batch_size', 50))
+            logger.info(f"全文索引: {index_path}")
         
-        success_count = 0
-        skipped_count = 0
-        error_count = 0
+        try:
+            exporter = MarkdownExporter(
+                template_dir=template_dir,
+                template_name=template_name,
+                config=config,
+                search_index=search_index
+            )
         
-        for i, item in enumerate(items):
-            try:
-                metadata = z_parser.get_item_metadata(item['itemID'])
-                creators = z_parser.get_item_creators(item['itemID'])
-                tags = z_parser.get_item_tags(item['itemID'])
-                notes = z_parser.get_item_notes(item['itemID'], convert_html=convert_html)
-                attachments = z_parser.get_item_attachments(item['itemID'])
-                collections = z_parser.get_item_collections(item['itemID'])
+            success_count = 0
+            skipped_count = 0
+            error_count = 0
+        
+            for i, item in enumerate(items):
+                try:
+                    metadata = z_parser.get_item_metadata(item['itemID'])
+                    creators = z_parser.get_item_creators(item['itemID'])
+                    tags = z_parser.get_item_tags(item['itemID'])
+                    notes = z_parser.get_item_notes(item['itemID'], convert_html=convert_html)
+                    attachments = z_parser.get_item_attachments(item['itemID'])
+                    collections = z_parser.get_item_collections(item['itemID'])
                 
-                item_data = {
-                    'title': metadata.get('title', 'Untitled'),
-                    'authors': [c['name'] for c in creators],
-                    'date': metadata.get('date', 'Unknown'),
-                    'type': item['typeName'],
-                    'doi': metadata.get('DOI', ''),
-                    'url': metadata.get('url', ''),
-                    'tags': tags,
-                    'key': item['key'],
-                    'publication': metadata.get('publicationTitle', ''),
-                    'abstract': metadata.get('abstractNote', ''),
-                    'notes': notes,
-                    'attachments': attachments,
-                    'collections': collections
-                }
+                    item_data = {
+                        'title': metadata.get('title', 'Untitled'),
+                        'authors': [c['name'] for c in creators],
+                        'date': metadata.get('date', 'Unknown'),
+                        'type': item['typeName'],
+                        'doi': metadata.get('DOI', ''),
+                        'url': metadata.get('url', ''),
+                        'tags': tags,
+                        'key': item['key'],
+                        'publication': metadata.get('publicationTitle', ''),
+                        'abstract': metadata.get('abstractNote', ''),
+                        'notes': notes,
+                        'attachments': attachments,
+                        'collections': collections
+                    }
                 
-                result = exporter.export(item_data, output_dir=args.out)
+                    result = exporter.export(item_data, output_dir=args.out)
                 
-                if result:
-                    success_count += 1
-                    logger.debug(f"已导出: {item_data['title']}")
-                else:
-                    skipped_count += 1
-                    logger.debug(f"已跳过: {item_data['title']}")
+                    if result:
+                        success_count += 1
+                        logger.debug(f"已导出: {item_data['title']}")
+                    else:
+                        skipped_count += 1
+                        logger.debug(f"已跳过: {item_data['title']}")
                 
-                if (i + 1) % 10 == 0 or (i + 1) == len(items):
-                    print(f"\r[*] 进度: {i+1}/{len(items)}", end="", flush=True)
+                    if (i + 1) % 10 == 0 or (i + 1) == len(items):
+                        print(f"\r[*] 进度: {i+1}/{len(items)}", end="", flush=True)
                     
-            except Exception as e:
-                error_count += 1
-                logger.error(f"导出条目 {item['key']} 失败: {e}", exc_info=True)
+                except Exception as e:
+                    error_count += 1
+                    logger.error(f"导出条目 {item['key']} 失败: {e}", exc_info=True)
 
-        print(f"\n[*] 导出完成！成功: {success_count}, 跳过: {skipped_count}, 失败: {error_count}")
-        print(f"[*] 文件保存在: {os.path.abspath(args.out)}")
+            print(f"\n[*] 导出完成！成功: {success_count}, 跳过: {skipped_count}, 失败: {error_count}")
+            print(f"[*] 文件保存在: {os.path.abspath(args.out)}")
         
-        summary = exporter.get_export_summary()
-        logger.info(f"导出摘要: {summary}")
+            summary = exporter.get_export_summary()
+            logger.info(f"导出摘要: {summary}")
+
+            if search_index and not args.limit and error_count == 0:
+                removed = search_index.prune(item['key'] for item in items)
+                logger.info(f"已从索引中移除 {removed} 个已删除的条目")
+        finally:
+            if search_index:
+                search_index.close()
 
         connector.close()
         logger.info("导出任务完成")
@@ -0,0 +1,140 @@
+import sqlite3
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable
+
+class SearchIndex:
+    """导出结果的 SQLite FTS5 全文索引（与 Markdown 导出同步增量更新）"""
+
+    INDEXED_FIELDS = ('title', 'authors', 'abstract', 'tags', 'notes')
+    QUERY_OPERATORS = ('AND', 'OR', 'NOT', 'NEAR')
+    QUERY_SYNTAX_CHARS = '":*()^'
+
+    def __init__(self, index_path: str, batch_size: int = 50):
+        self.index_path = index_path
+        self.batch_size = batch_size
+        self._pending = 0
+        Path(index_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(index_path)
+        self.conn.row_factory = sqlite3.Row
+        self._create_schema()
+
+    def _create_schema(self):
+        try:
+            self.conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+                title, authors, abstract, tags, notes
+            )
+            """)
+        except sqlite3.OperationalError as e:
+            self.conn.close()
+            raise RuntimeError(f"当前 SQLite 不支持 FTS5，无法创建搜索索引: {e}")
+        # items_meta.id 与 items_fts.rowid 一一对应，按 rowid 增删无需扫描全文表
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS items_meta (
+            id INTEGER PRIMARY KEY,
+            key TEXT NOT NULL UNIQUE,
+            hash TEXT NOT NULL,
+            path TEXT
+        )
+        """)
+        self.conn.commit()
+
+    def _to_text(self, value) -> str:
+        if value is None:
+            return ''
+        if isinstance(value, (list, tuple)):
+            return '\n'.join(str(v) for v in value if v)
+        return str(value)
+
+    def _item_hash(self, fields: Dict[str, str]) -> str:
+        payload = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+        return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+    def update(self, item_data: Dict[str, Any], file_path: Optional[Path] = None) -> bool:
+        """索引单个条目；内容未变化时跳过，返回是否写入了索引"""
+        key = item_data.get('key')
+        if not key:
+            return False
+
+        fields = {name: self._to_text(item_data.get(name)) for name in self.INDEXED_FIELDS}
+        path = str(file_path) if file_path else None
+        new_hash = self._item_hash(fields)
+
+        row = self.conn.execute(
+            "SELECT id, hash, path FROM items_meta WHERE key = ?", (key,)
+        ).fetchone()
+        if row and row['hash'] == new_hash:
+            if path and row['path'] != path:
+                self.conn.execute("UPDATE items_meta SET path = ? WHERE id = ?", (path, row['id']))
+                self._mark_pending()
+            return False
+
+        if row:
+            row_id = row['id']
+            self.conn.execute("DELETE FROM items_fts WHERE rowid = ?", (row_id,))
+            self.conn.execute(
+                "UPDATE items_meta SET hash = ?, path = ? WHERE id = ?", (new_hash, path, row_id)
+            )
+        else:
+            cursor = self.conn.execute(
+                "INSERT INTO items_meta (key, hash, path) VALUES (?, ?, ?)", (key, new_hash, path)
+            )
+            row_id = cursor.lastrowid
+
+        self.conn.execute(
+            "INSERT INTO items_fts (rowid, title, authors, abstract, tags, notes) VALUES (?, ?, ?, ?, ?, ?)",
+            (row_id, *(fields[name] for name in self.INDEXED_FIELDS))
+        )
+        self._mark_pending()
+        return True
+
+    def _mark_pending(self):
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.commit()
+
+    def prune(self, keep_keys: Iterable[str]) -> int:
+        """删除不在 keep_keys 中的条目（例如已在 Zotero 中删除的条目）"""
+        keep = set(keep_keys)
+        stale = [row['id'] for row in self.conn.execute("SELECT id, key FROM items_meta")
+                 if row['key'] not in keep]
+        for row_id in stale:
+            self.conn.execute("DELETE FROM items_fts WHERE rowid = ?", (row_id,))
+            self.conn.execute("DELETE FROM items_meta WHERE id = ?", (row_id,))
+        if stale:
+            self.commit()
+        return len(stale)
+
+    @classmethod
+    def build_query(cls, query: str) -> str:
+        """未使用 FTS5 语法的查询按词加引号，避免 self-attention 之类的词被误解析"""
+        terms = query.split()
+        if any(c in query for c in cls.QUERY_SYNTAX_CHARS) or \
+                any(t in cls.QUERY_OPERATORS or t.startswith('NEAR(') for t in terms):
+            return query
+        return ' '.join(f'"{t}"' for t in terms)
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        sql = """
+        SELECT m.key, f.title, m.path,
+               snippet(items_fts, -1, '[', ']', '...', 12) AS snippet
+        FROM items_fts f
+        JOIN items_meta m ON f.rowid = m.id
+        WHERE items_fts MATCH ?
+        ORDER BY bm25(items_fts)
+        LIMIT ?
+        """
+        cursor = self.conn.execute(sql, (self.build_query(query), limit))
+        return [dict(row) for row in cursor.fetchall()]
+
+    def commit(self):
+        self.conn.commit()
+        self._pending = 0
+
+    def close(self):
+        if self.conn:
+            self.commit()
+            self.conn.close()
+            self.conn = None